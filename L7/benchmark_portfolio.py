@@ -0,0 +1,59 @@
+import os
+import time
+
+import numpy as np
+
+from portfolio import optimal_allocation, optimal_allocation_batch
+
+
+def benchmark(num_scenarios, num_assets, n_jobs=1, repeats=3, random_seed=0):
+    """
+    Throughput of optimal_allocation_batch in scenarios per second
+
+    Parameters:
+    num_scenarios (int): Number of delta/sigma scenarios
+    num_assets (int): Number of assets per scenario
+    n_jobs (int): Worker processes passed to optimal_allocation_batch
+    repeats (int): Timed runs; the best one is reported
+    """
+    rng = np.random.default_rng(random_seed)
+    delta = rng.uniform(0, 100, (num_scenarios, num_assets))
+    sigma = rng.uniform(1, 20, (num_scenarios, num_assets))
+
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        optimal_allocation_batch(delta, sigma, n_jobs=n_jobs)
+        best = min(best, time.perf_counter() - start)
+    return num_scenarios / best
+
+
+def benchmark_loop(num_scenarios, num_assets, random_seed=0):
+    """Throughput of calling optimal_allocation once per scenario (baseline)"""
+    rng = np.random.default_rng(random_seed)
+    delta = rng.uniform(0, 100, (num_scenarios, num_assets))
+    sigma = rng.uniform(1, 20, (num_scenarios, num_assets))
+
+    start = time.perf_counter()
+    for d, s in zip(delta, sigma):
+        optimal_allocation(d, s)
+    return num_scenarios / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    n_workers = os.cpu_count() or 1
+    if n_workers == 1:
+        print("Single core: the process-pool rows are skipped (n_jobs=-1 runs serially)")
+    print(f"{'scenarios':>10} {'assets':>7} {'mode':>12} {'scenarios/s':>14}")
+    print("-" * 46)
+    for num_scenarios, num_assets in [(50_000, 3), (50_000, 50), (10_000, 1000)]:
+        # The per-scenario loop is slow, so it is timed on fewer scenarios
+        loop_scenarios = min(num_scenarios, 5_000)
+        rate = benchmark_loop(loop_scenarios, num_assets)
+        print(f"{loop_scenarios:>10} {num_assets:>7} {'loop':>12} {rate:>14,.0f}")
+        rate = benchmark(num_scenarios, num_assets)
+        print(f"{num_scenarios:>10} {num_assets:>7} {'vectorized':>12} {rate:>14,.0f}")
+        if n_workers > 1:
+            rate = benchmark(num_scenarios, num_assets, n_jobs=n_workers)
+            mode = f"{n_workers} processes"
+            print(f"{num_scenarios:>10} {num_assets:>7} {mode:>12} {rate:>14,.0f}")
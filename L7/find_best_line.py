@@ -1,8 +1,20 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
+from line_fitting import line_distances
 
-def find_best_line(num_points=1000, num_iterations=100, random_seed=None):
+
+def generate_points(num_points):
+    """
+    Step 1-2: Generate random points in range 0-1
+    """
+    print(f"Generating {num_points} random points...")
+    points_x = np.random.uniform(0, 1, num_points)
+    points_y = np.random.uniform(0, 1, num_points)
+    return points_x, points_y
+
+
+def find_best_line(num_points=1000, num_iterations=100, random_seed=None, distance_mode="vertical",
+                   points=None):
     """
     Function that finds the best line for randomly generated points
 
@@ -10,26 +22,18 @@ def find_best_line(num_points=1000, num_iterations=100, random_seed=None):
     num_points (int): Number of points to generate
     num_iterations (int): Number of lines to generate and test
     random_seed (int): Random seed for reproducible results
+    distance_mode (str): 'vertical' or 'perpendicular' distance from the line
+    points (tuple): (points_x, points_y) to search instead of generating
+                    num_points new ones (e.g. to plot them afterwards)
     """
 
     if random_seed is not None:
         np.random.seed(random_seed)
 
     # Step 1-2: Generate random points in range 0-1
-    print(f"Generating {num_points} random points...")
-    points_x = np.random.uniform(0, 1, num_points)
-    points_y = np.random.uniform(0, 1, num_points)
-
-    # Step 3: Display the points
-    plt.figure(figsize=(12, 5))
-
-    plt.subplot(1, 2, 1)
-    plt.scatter(points_x, points_y, alpha=0.6, s=10)
-    plt.title(f'{num_points} Random Points')
-    plt.xlabel('x')
-    plt.ylabel('y')
-    plt.grid(True, alpha=0.3)
-    plt.axis('equal')
+    if points is None:
+        points = generate_points(num_points)
+    points_x, points_y = points
 
     # Variables to store the best line
     best_a = None
@@ -49,10 +53,10 @@ def find_best_line(num_points=1000, num_iterations=100, random_seed=None):
         # Line equation: y = ax + b
         # Distance from point (x_i, y_i) to line y = ax + b is:
         # |y_i - (ax_i + b)| / sqrt(1 + a^2)
-        # For simplicity, we use vertical distance: |y_i - (ax_i + b)|
+        # distance_mode selects it, or the vertical distance |y_i - (ax_i + b)|
+        # (see line_fitting.py for total least squares and RANSAC fits)
 
-        predicted_y = a * points_x + b
-        distances = np.abs(points_y - predicted_y)
+        distances = line_distances(points_x, points_y, a, b, mode=distance_mode)
         avg_distance = np.mean(distances)
 
         # Step 6: Store the results
@@ -74,26 +78,6 @@ def find_best_line(num_points=1000, num_iterations=100, random_seed=None):
     print(f"Minimum average distance = {min_avg_distance:.4f}")
     print(f"Line equation: y = {best_a:.4f}x + {best_b:.4f}")
 
-    # Step 10: Display the best line
-    plt.subplot(1, 2, 2)
-    plt.scatter(points_x, points_y, alpha=0.6, s=10, label='Random points')
-
-    # Draw the best line
-    x_line = np.linspace(0, 1, 100)
-    y_line = best_a * x_line + best_b
-    plt.plot(x_line, y_line, 'r-', linewidth=2,
-             label=f'Best line: y = {best_a:.3f}x + {best_b:.3f}')
-
-    plt.title(f'Best Line Found\n(Average distance: {min_avg_distance:.4f})')
-    plt.xlabel('x')
-    plt.ylabel('y')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.axis('equal')
-
-    plt.tight_layout()
-    plt.show()
-
     return best_a, best_b, min_avg_distance, all_results
 
 
@@ -112,46 +96,29 @@ def analyze_results(all_results):
     print(f"Range of average distances: {np.min(distances):.4f} - {np.max(distances):.4f}")
     print(f"Mean of average distances: {np.mean(distances):.4f}")
 
-    # Display distribution of results
-    plt.figure(figsize=(15, 4))
-
-    plt.subplot(1, 3, 1)
-    plt.hist(a_values, bins=20, alpha=0.7, edgecolor='black')
-    plt.title('Distribution of a values (slope)')
-    plt.xlabel('a')
-    plt.ylabel('Frequency')
-    plt.grid(True, alpha=0.3)
-
-    plt.subplot(1, 3, 2)
-    plt.hist(b_values, bins=20, alpha=0.7, edgecolor='black')
-    plt.title('Distribution of b values (intercept)')
-    plt.xlabel('b')
-    plt.ylabel('Frequency')
-    plt.grid(True, alpha=0.3)
-
-    plt.subplot(1, 3, 3)
-    plt.hist(distances, bins=20, alpha=0.7, edgecolor='black')
-    plt.title('Distribution of average distances')
-    plt.xlabel('Average distance')
-    plt.ylabel('Frequency')
-    plt.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.show()
-
 
 # Run the main code
 if __name__ == "__main__":
+    import reporting
+
+    # np.random.seed(42)  # for reproducible results
+    points_x, points_y = generate_points(1000)
+
     # Run the function with required parameters
     best_a, best_b, min_distance, results = find_best_line(
-        num_points=1000,
         num_iterations=100,
-        #  random_seed=42  # for reproducible results
+        points=(points_x, points_y),
     )
 
     # Detailed analysis of results
     analyze_results(results)
 
+    # Steps 3 and 10: Save the points, the best line and the results distribution
+    reporting.plot_best_line(points_x, points_y, best_a, best_b, min_distance,
+                             'plots/find_best_line.png')
+    reporting.plot_results_distribution(results, 'plots/find_best_line_results.png')
+    print("Plots saved to plots/")
+
     print(f"\n{'=' * 50}")
     print("Code completed successfully!")
     print(f"Best line found: y = {best_a:.4f}x + {best_b:.4f}")
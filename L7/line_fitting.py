@@ -0,0 +1,241 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Upper bound on the number of (hypothesis, point) distances held in memory
+# at once while scoring RANSAC hypotheses.
+SCORE_BUDGET = 4_000_000
+
+
+def line_distances(points_x, points_y, a, b, mode="vertical"):
+    """
+    Distances of points from the line y = ax + b
+
+    Parameters:
+    points_x, points_y (np.ndarray): Point coordinates
+    a (float): Slope
+    b (float): Y-intercept
+    mode (str): 'vertical' for |y - (ax + b)|,
+                'perpendicular' for |y - (ax + b)| / sqrt(1 + a^2)
+    """
+    residuals = np.abs(points_y - (a * points_x + b))
+    if mode == "vertical":
+        return residuals
+    if mode == "perpendicular":
+        return residuals / np.sqrt(1 + a ** 2)
+    raise ValueError(f"Unknown distance mode: {mode!r}")
+
+
+def _to_slope_intercept(nx, ny, c):
+    """
+    Convert the normal form nx·x + ny·y = c to y = ax + b
+
+    Near-vertical lines get very large slopes; a vertical line (|ny| below
+    1e-12, i.e. within rounding of cos(π/2)) has no slope-intercept form and
+    is returned as a = b = inf.
+    """
+    if abs(ny) < 1e-12:
+        return np.inf, np.inf
+    return -nx / ny, c / ny
+
+
+def fit_line_tls(points_x, points_y, return_normal=False):
+    """
+    Total least squares line: minimises the sum of squared perpendicular distances
+
+    The line passes through the centroid along the principal axis of the
+    point cloud, so it is computed in closed form in a single pass.
+
+    Parameters:
+    points_x, points_y (np.ndarray): Point coordinates
+    return_normal (bool): Return the normal form (nx, ny, c) with
+                          nx·x + ny·y = c and (nx, ny) a unit vector, which
+                          also represents (near-)vertical lines
+
+    Returns:
+    a (float): Slope (see _to_slope_intercept for vertical lines)
+    b (float): Y-intercept
+    """
+    x_mean = np.mean(points_x)
+    y_mean = np.mean(points_y)
+    dx = points_x - x_mean
+    dy = points_y - y_mean
+
+    sxx = np.dot(dx, dx)
+    syy = np.dot(dy, dy)
+    sxy = np.dot(dx, dy)
+
+    # Angle of the principal axis: tan(2θ) = 2·Sxy / (Sxx - Syy)
+    theta = 0.5 * np.arctan2(2 * sxy, sxx - syy)
+    nx, ny = -np.sin(theta), np.cos(theta)
+    c = nx * x_mean + ny * y_mean
+    if return_normal:
+        return nx, ny, c
+    return _to_slope_intercept(nx, ny, c)
+
+
+def _sample_hypotheses(rng, points_x, points_y, count):
+    """Draw `count` two-point line hypotheses in normal form n·p = c"""
+    idx = rng.integers(0, len(points_x), size=(count, 2))
+    x1, y1 = points_x[idx[:, 0]], points_y[idx[:, 0]]
+    x2, y2 = points_x[idx[:, 1]], points_y[idx[:, 1]]
+
+    # Unit normal to the segment (x1, y1) -> (x2, y2)
+    nx = y1 - y2
+    ny = x2 - x1
+    norm = np.hypot(nx, ny)
+    valid = norm > 0  # drop pairs of identical points
+    nx = nx[valid] / norm[valid]
+    ny = ny[valid] / norm[valid]
+    c = nx * x1[valid] + ny * y1[valid]
+    return nx, ny, c
+
+
+def _count_inliers(points_x, points_y, nx, ny, c, threshold):
+    """Inlier count of every hypothesis, scored in memory-bounded chunks"""
+    counts = np.empty(len(nx), dtype=np.int64)
+    chunk = max(1, SCORE_BUDGET // max(1, len(points_x)))
+    for start in range(0, len(nx), chunk):
+        stop = start + chunk
+        dist = np.abs(np.outer(nx[start:stop], points_x)
+                      + np.outer(ny[start:stop], points_y)
+                      - c[start:stop, None])
+        counts[start:stop] = np.count_nonzero(dist <= threshold, axis=1)
+    return counts
+
+
+def required_iterations(inlier_ratio, confidence, sample_size=2):
+    """
+    Number of RANSAC draws needed to hit an all-inlier sample with the given confidence
+
+    k = log(1 - confidence) / log(1 - w^s)
+    """
+    if inlier_ratio <= 0:
+        return np.inf
+    good_sample = inlier_ratio ** sample_size
+    if good_sample >= 1:
+        return 0
+    return int(np.ceil(np.log(1 - confidence) / np.log(1 - good_sample)))
+
+
+def fit_line_ransac(points_x, points_y, threshold, confidence=0.99,
+                    max_iterations=1000, batch_size=8, n_jobs=1,
+                    refine=True, random_seed=None, return_normal=False):
+    """
+    Robust line fit with RANSAC
+
+    Hypotheses are lines through two random points, scored by the number of
+    points within `threshold` perpendicular distance. Each round draws at
+    most `batch_size` hypotheses, never more than the current estimate of the
+    required iterations, so sampling stops as soon as the best inlier ratio
+    so far guarantees `confidence`. With n_jobs > 1 every round is scored by
+    threads over chunks of the points (numpy releases the GIL), so the points
+    are neither copied nor pickled.
+
+    Parameters:
+    points_x, points_y (np.ndarray): Point coordinates
+    threshold (float): Maximum perpendicular distance of an inlier
+    confidence (float): Probability of drawing at least one all-inlier sample
+    max_iterations (int): Hard limit on the number of hypotheses
+    batch_size (int): Maximum hypotheses scored per round
+    n_jobs (int): Scoring threads (-1 for all cores)
+    refine (bool): Refit the best line on its inliers with total least squares
+    random_seed (int): Random seed for reproducible results
+    return_normal (bool): Return the line as (nx, ny, c) instead of (a, b),
+                          see fit_line_tls
+
+    Returns:
+    a (float): Slope (see _to_slope_intercept for vertical lines)
+    b (float): Y-intercept
+    inliers (np.ndarray): Boolean inlier mask
+    num_iterations (int): Number of hypotheses evaluated
+
+    With return_normal=True: (nx, ny, c, inliers, num_iterations)
+    """
+    points_x = np.asarray(points_x, dtype=float)
+    points_y = np.asarray(points_y, dtype=float)
+    if len(points_x) < 2:
+        raise ValueError("At least two points are required")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1 (exclusive)")
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    rng = np.random.default_rng(random_seed)
+    best = None
+    best_count = 0
+    num_iterations = 0
+    needed = max_iterations
+
+    executor = None
+    if n_jobs > 1:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+        bounds = np.linspace(0, len(points_x), n_jobs + 1).astype(int)
+        point_chunks = [(points_x[lo:hi], points_y[lo:hi])
+                        for lo, hi in zip(bounds[:-1], bounds[1:])]
+    try:
+        while num_iterations < min(needed, max_iterations):
+            size = min(batch_size, min(needed, max_iterations) - num_iterations)
+            nx, ny, c = _sample_hypotheses(rng, points_x, points_y, size)
+            num_iterations += size
+
+            if executor is None:
+                counts = _count_inliers(points_x, points_y, nx, ny, c, threshold)
+            else:
+                counts = sum(executor.map(
+                    lambda chunk: _count_inliers(*chunk, nx, ny, c, threshold),
+                    point_chunks))
+
+            # Keep the best non-degenerate hypothesis even if it has no inliers
+            if len(counts) and (best is None or counts.max() > best_count):
+                i = int(np.argmax(counts))
+                best_count = int(counts[i])
+                best = (nx[i], ny[i], c[i])
+
+            # Early termination once the inlier ratio is confident enough
+            needed = required_iterations(best_count / len(points_x), confidence)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if best is None:
+        raise ValueError("Could not sample a non-degenerate line (all sampled points identical)")
+
+    nx, ny, c = best
+    inliers = np.abs(nx * points_x + ny * points_y - c) <= threshold
+    if refine and np.count_nonzero(inliers) >= 2:
+        nx, ny, c = fit_line_tls(points_x[inliers], points_y[inliers], return_normal=True)
+        inliers = np.abs(nx * points_x + ny * points_y - c) <= threshold
+
+    if return_normal:
+        return nx, ny, c, inliers, num_iterations
+    a, b = _to_slope_intercept(nx, ny, c)
+    return a, b, inliers, num_iterations
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    num_points = 1_000_000
+    num_outliers = int(0.3 * num_points)
+
+    x = rng.uniform(0, 1, num_points)
+    y = 0.7 * x + 0.2 + rng.normal(0, 0.01, num_points)
+    y[:num_outliers] = rng.uniform(0, 1, num_outliers)
+
+    a, b = fit_line_tls(x, y)
+    print(f"Total least squares: y = {a:.4f}x + {b:.4f}")
+
+    a, b, inliers, iterations = fit_line_ransac(x, y, threshold=0.03, random_seed=0)
+    print(f"RANSAC:              y = {a:.4f}x + {b:.4f}")
+    print(f"Inliers: {np.count_nonzero(inliers)} / {num_points}, hypotheses tested: {iterations}")
+
+    # Serial vs threaded scoring, with 80% outliers so that many hypotheses are needed
+    y[:int(0.8 * num_points)] = rng.uniform(0, 1, int(0.8 * num_points))
+    for n_jobs in [1, os.cpu_count() or 1]:
+        start = time.perf_counter()
+        _, _, _, iterations = fit_line_ransac(x, y, threshold=0.03, n_jobs=n_jobs, random_seed=0)
+        print(f"n_jobs={n_jobs}: {iterations} hypotheses in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,300 @@
+import os
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from math import comb
+
+import numpy as np
+
+# Number of (scenario, asset) values solved per vectorized block by
+# optimal_allocation_batch; keeps the sort/cumsum temporaries cache-friendly.
+BATCH_BUDGET = 1_000_000
+
+
+def net_profit(x, delta, sigma):
+    """
+    Risk-adjusted net profit: Σ x·δ - ½ Σ x²·σ²
+
+    Parameters:
+    x (array-like): Investment fraction per asset
+    delta (np.ndarray): Expected return per asset
+    sigma (np.ndarray): Volatility per asset
+    """
+    x = np.asarray(x, dtype=float)
+    return np.sum(x * delta, axis=-1) - 0.5 * np.sum((x ** 2) * (sigma ** 2), axis=-1)
+
+
+def _water_filling(delta, sigma):
+    """Row-wise optimal_allocation for (scenarios × assets) arrays"""
+    if delta.shape[1] == 0:
+        return np.zeros(delta.shape)  # no assets -> nothing to allocate
+    w = 1 / sigma ** 2
+    order = np.argsort(-delta, axis=1)
+    d_sorted = np.take_along_axis(delta, order, axis=1)
+    w_sorted = np.take_along_axis(w, order, axis=1)
+
+    # λ_k when the k largest δ are active and Σx = 1
+    cum_w = np.cumsum(w_sorted, axis=1)
+    lam = (np.cumsum(w_sorted * d_sorted, axis=1) - 1) / cum_w
+
+    # The active set is the longest prefix with δ_(k) > λ_k
+    k = np.count_nonzero(d_sorted > lam, axis=1)
+    lam = lam[np.arange(len(lam)), k - 1]
+    lam = np.maximum(lam, 0.0)  # budget not binding -> λ = 0
+
+    return np.maximum(0.0, w * (delta - lam[:, None]))
+
+
+def _check_inputs(delta, sigma):
+    delta = np.asarray(delta, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    if np.any(sigma <= 0):
+        raise ValueError("sigma must be positive")
+    return delta, sigma
+
+
+def optimal_allocation(delta, sigma):
+    """
+    Exact maximiser of net_profit over the simplex {x ≥ 0, Σx ≤ 1}
+
+    The objective is separable and strictly concave, so the KKT conditions give
+    x_i = max(0, (δ_i - λ) / σ_i²) with λ ≥ 0 the multiplier of Σx ≤ 1.
+    λ is found by water-filling over the assets sorted by δ: O(n log n).
+
+    Parameters:
+    delta (np.ndarray): Expected return per asset
+    sigma (np.ndarray): Volatility per asset (must be positive)
+
+    Returns:
+    x (np.ndarray): Optimal investment fraction per asset
+    """
+    delta, sigma = _check_inputs(delta, sigma)
+    if delta.shape != sigma.shape or delta.ndim != 1:
+        raise ValueError("delta and sigma must be 1-D arrays of the same length")
+    return _water_filling(delta[None, :], sigma[None, :])[0]
+
+
+def optimal_allocation_batch(delta, sigma, n_jobs=1, chunk_size=None):
+    """
+    optimal_allocation for many return/volatility scenarios at once
+
+    Every scenario is solved by the same vectorized water-filling; with
+    n_jobs > 1 the scenarios are split into chunks solved in worker processes.
+
+    Parameters:
+    delta (np.ndarray): Expected returns, shape (scenarios, assets)
+    sigma (np.ndarray): Volatilities, shape (scenarios, assets) or (assets,)
+    n_jobs (int): Worker processes (-1 for all cores)
+    chunk_size (int): Scenarios per vectorized block / worker task
+                      (default: about BATCH_BUDGET values per block, split
+                      evenly across the workers)
+
+    Returns:
+    x (np.ndarray): Optimal allocations, shape (scenarios, assets)
+    values (np.ndarray): Net profit of each scenario's allocation, shape (scenarios,)
+    """
+    delta, sigma = _check_inputs(delta, sigma)
+    if delta.ndim != 2:
+        raise ValueError("delta must have shape (scenarios, assets)")
+    delta, sigma = np.broadcast_arrays(delta, sigma)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, BATCH_BUDGET // max(1, delta.shape[1]))
+        chunk_size = max(1, min(chunk_size, -(-len(delta) // n_jobs)))
+
+    starts = range(0, len(delta), chunk_size)
+    blocks = [(delta[i:i + chunk_size], sigma[i:i + chunk_size]) for i in starts]
+    if n_jobs > 1 and len(blocks) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_water_filling, *zip(*blocks)))
+    else:
+        results = [_water_filling(d, s) for d, s in blocks]
+
+    x = np.vstack(results) if results else np.zeros(delta.shape)  # no scenarios
+    return x, net_profit(x, delta, sigma)
+
+
+def grid_search(delta, sigma, grid):
+    """
+    Brute-force argmax of net_profit over grid points with Σx ≤ 1
+
+    Only practical for a handful of assets; used to cross-check
+    optimal_allocation.
+
+    Returns:
+    best_x (np.ndarray): Best grid point
+    best_val (float): Net profit at best_x
+    """
+    best_val = -np.inf
+    best_x = np.zeros(len(delta))
+    for x in product(grid, repeat=len(delta)):
+        if sum(x) <= 1:
+            val = net_profit(x, delta, sigma)
+            if val > best_val:
+                best_val = val
+                best_x = np.array(x)
+    return best_x, best_val
+
+
+def _simplex_lattice(d, m):
+    """
+    All non-negative integer vectors of length d with sum ≤ m, ordered by sum
+
+    Returns:
+    points (np.ndarray): Shape (C(m+d, d), d)
+    sums (np.ndarray): Row sums of points (non-decreasing)
+    """
+    points = np.zeros((1, 0), dtype=np.int64)
+    sums = np.zeros(1, dtype=np.int64)
+    for _ in range(d):
+        # Append one coordinate k to every row that still has room for it
+        blocks, block_sums = [], []
+        for k in range(m + 1):
+            keep = sums <= m - k
+            blocks.append(np.column_stack([points[keep], np.full(np.count_nonzero(keep), k)]))
+            block_sums.append(sums[keep] + k)
+        points = np.vstack(blocks)
+        sums = np.concatenate(block_sums)
+    order = np.argsort(sums, kind='stable')
+    return points[order], sums[order]
+
+
+def iter_simplex_lattice(d, m, chunk_size=100_000):
+    """
+    Yield the integer simplex lattice {k ∈ Nᵈ : Σk ≤ m} in chunks of chunk_size points
+
+    Only feasible points are generated and memory stays O(chunk_size·d)
+    instead of the (m+1)ᵈ cube. The last t coordinates come from a template
+    lattice sorted by sum (at most chunk_size rows), so the tails that fit
+    after a leading prefix with sum s are just its first C(m-s+t, t) rows.
+    The leading prefixes are themselves produced chunk by chunk by a
+    recursive call, and prefixes with the same sum are expanded at once
+    with repeat/tile.
+    """
+    # Largest trailing template that still fits in one chunk
+    t = 1
+    while t < d and comb(m + t + 1, t + 1) <= chunk_size:
+        t += 1
+    template, _ = _simplex_lattice(t, m)
+
+    if t == d:
+        prefix_chunks = [np.zeros((1, 0), dtype=np.int64)]
+    else:
+        prefix_chunks = iter_simplex_lattice(d - t, m, chunk_size)
+
+    buffer, buffered = [], 0
+    for prefixes in prefix_chunks:
+        prefix_sums = prefixes.sum(axis=1)
+        order = np.argsort(prefix_sums, kind='stable')
+        prefixes, prefix_sums = prefixes[order], prefix_sums[order]
+        bounds = np.searchsorted(prefix_sums, np.arange(m + 2))
+
+        for s in range(m + 1):
+            lo, hi = bounds[s], bounds[s + 1]
+            tail = template[:comb(m - s + t, t)]
+            per_block = max(1, chunk_size // len(tail))
+            for start in range(lo, hi, per_block):
+                group = prefixes[start:min(start + per_block, hi)]
+                buffer.append(np.hstack([np.repeat(group, len(tail), axis=0),
+                                         np.tile(tail, (len(group), 1))]))
+                buffered += len(buffer[-1])
+                # Merge small sub-blocks and split big ones into full chunks
+                while buffered >= chunk_size:
+                    merged = np.vstack(buffer)
+                    yield merged[:chunk_size]
+                    buffer = [merged[chunk_size:].copy()]
+                    buffered = len(buffer[0])
+    if buffered:
+        yield np.vstack(buffer)
+
+
+def simplex_grid_search(delta, sigma, grid_size, chunk_size=100_000, return_points=False):
+    """
+    Vectorized grid search over the lattice x = k / (grid_size - 1), Σx ≤ 1
+
+    Equivalent to grid_search with grid = np.linspace(0, 1, grid_size), but
+    enumerates only feasible points and scores them in chunks, in one pass.
+
+    Parameters:
+    delta (np.ndarray): Expected return per asset
+    sigma (np.ndarray): Volatility per asset
+    grid_size (int): Number of grid values per asset (including 0 and 1), at least 2
+    chunk_size (int): Maximum number of points scored at once
+    return_points (bool): Also return every feasible point and its net profit
+                          (for plotting; needs memory for the whole lattice)
+
+    Returns:
+    best_x (np.ndarray): Best grid point
+    best_val (float): Net profit at best_x
+    points (np.ndarray or None): Feasible points, shape (count, n)
+    values (np.ndarray or None): Net profit of each point
+    """
+    if grid_size < 2:
+        raise ValueError("grid_size must be at least 2 (the grid includes 0 and 1)")
+    delta = np.asarray(delta, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    m = grid_size - 1
+    best_val = -np.inf
+    best_x = np.zeros(len(delta))
+    all_points, all_values = [], []
+
+    for block in iter_simplex_lattice(len(delta), m, chunk_size):
+        x = block / m
+        values = x @ delta - 0.5 * ((x ** 2) @ (sigma ** 2))
+        i = int(np.argmax(values))
+        if values[i] > best_val:
+            best_val = values[i]
+            best_x = x[i]
+        if return_points:
+            all_points.append(x)
+            all_values.append(values)
+
+    if not return_points:
+        return best_x, best_val, None, None
+    return best_x, best_val, np.vstack(all_points), np.concatenate(all_values)
+
+
+if __name__ == "__main__":
+    # Cross-check the exact solver against the grid search on small cases
+    rng = np.random.default_rng(0)
+    grid = np.linspace(0, 1, 21)
+    for _ in range(20):
+        n = rng.integers(1, 4)
+        delta = rng.uniform(-5, 60, n)
+        sigma = rng.uniform(1, 15, n)
+        x = optimal_allocation(delta, sigma)
+        grid_x, grid_val = grid_search(delta, sigma, grid)
+        lattice_x, lattice_val, _, _ = simplex_grid_search(delta, sigma, len(grid), chunk_size=50)
+        assert np.isclose(lattice_val, grid_val), (grid_val, lattice_val)
+        exact_val = net_profit(x, delta, sigma)
+        assert np.sum(x) <= 1 + 1e-12 and np.all(x >= 0)
+        assert exact_val >= grid_val - 1e-9, (delta, sigma, x, grid_x)
+        print(f"n={n}  exact={exact_val:10.4f}  grid={grid_val:10.4f}  x={np.round(x, 3)}")
+
+    # Finer grids and more assets than the G^d cube allows
+    delta = rng.uniform(0, 100, 6)
+    sigma = rng.uniform(1, 20, 6)
+    grid_x, grid_val, _, _ = simplex_grid_search(delta, sigma, 41)
+    exact_val = net_profit(optimal_allocation(delta, sigma), delta, sigma)
+    print(f"6 assets, {comb(40 + 6, 6)} lattice points: grid={grid_val:.4f}  exact={exact_val:.4f}")
+
+    # 12 assets, 26 grid values: C(37, 12) ≈ 1.9e9 points, so only the first
+    # chunks are drawn; peak memory must stay within a fixed number of chunks
+    chunk_size = 100_000
+    chunk_bytes = chunk_size * 12 * np.dtype(np.int64).itemsize
+    tracemalloc.start()
+    lattice = iter_simplex_lattice(12, 25, chunk_size)
+    for _ in range(20):
+        next(lattice)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak <= 10 * chunk_bytes, peak
+    print(f"12 assets, grid 26: peak {peak / 1e6:.1f} MB over 20 chunks of {chunk_bytes / 1e6:.1f} MB")
+
+    # Thousands of assets
+    delta = rng.uniform(0, 100, 5000)
+    sigma = rng.uniform(1, 20, 5000)
+    x = optimal_allocation(delta, sigma)
+    print(f"5000 assets: {np.count_nonzero(x)} active, Σx={np.sum(x):.6f}, "
+          f"net profit={net_profit(x, delta, sigma):.4f}")
@@ -0,0 +1,106 @@
+"""
+Plots for the L7 scripts, rendered to image files
+
+matplotlib is imported lazily, with the non-interactive Agg backend unless
+pyplot is already loaded, so the compute modules (find_best_line, argminmax,
+portfolio, line_fitting) never load it and the plots work in headless batch jobs.
+"""
+import os
+import sys
+
+import numpy as np
+
+
+def _pyplot():
+    # Pick the headless backend only on the first import of pyplot, so an
+    # interactive session the caller already set up is left alone
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_figure(fig, path):
+    """Write a figure to `path` (creating its directory) and release it"""
+    plt = _pyplot()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(path, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+
+def plot_best_line(points_x, points_y, best_a, best_b, min_avg_distance, path):
+    """The random points, and the best line found next to them"""
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+
+    ax1.scatter(points_x, points_y, alpha=0.6, s=10)
+    ax1.set_title(f'{len(points_x)} Random Points')
+    ax1.set_xlabel('x')
+    ax1.set_ylabel('y')
+    ax1.grid(True, alpha=0.3)
+    ax1.axis('equal')
+
+    ax2.scatter(points_x, points_y, alpha=0.6, s=10, label='Random points')
+    x_line = np.linspace(0, 1, 100)
+    y_line = best_a * x_line + best_b
+    ax2.plot(x_line, y_line, 'r-', linewidth=2,
+             label=f'Best line: y = {best_a:.3f}x + {best_b:.3f}')
+    ax2.set_title(f'Best Line Found\n(Average distance: {min_avg_distance:.4f})')
+    ax2.set_xlabel('x')
+    ax2.set_ylabel('y')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    ax2.axis('equal')
+
+    fig.tight_layout()
+    return save_figure(fig, path)
+
+
+def plot_results_distribution(all_results, path):
+    """Histograms of the tested slopes, intercepts and average distances"""
+    plt = _pyplot()
+    all_results = np.array(all_results)
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4))
+
+    columns = [
+        ('Distribution of a values (slope)', 'a'),
+        ('Distribution of b values (intercept)', 'b'),
+        ('Distribution of average distances', 'Average distance'),
+    ]
+    for i, (ax, (title, xlabel)) in enumerate(zip(axes, columns)):
+        ax.hist(all_results[:, i], bins=20, alpha=0.7, edgecolor='black')
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Frequency')
+        ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return save_figure(fig, path)
+
+
+def plot_investment_grid(points, values, best_x, best_val, path):
+    """3-asset investment grid coloured by net profit, with the argminmax marked"""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 7))
+    ax = fig.add_subplot(111, projection='3d')
+    sc = ax.scatter(points[:, 0], points[:, 1], points[:, 2], c=values, cmap='viridis', s=50)
+    ax.set_xlabel('Investment in A')
+    ax.set_ylabel('Investment in B')
+    ax.set_zlabel('Investment in C')
+    ax.set_title('Investment Distribution with Net Profit as Color')
+
+    # מסמן את argminmax
+    ax.scatter(best_x[0], best_x[1], best_x[2], color='red', s=150, label='argminmax')
+    ax.legend()
+    fig.colorbar(sc, label='Net Profit')
+
+    # הוספת טקסט בתחתית עם ערכי argminmax
+    text_str = (f"argminmax:\nx1={best_x[0]:.2f}, x2={best_x[1]:.2f}, x3={best_x[2]:.2f}\n"
+                f"Net Profit={best_val:.2f}")
+    fig.text(0.15, 0.05, text_str, fontsize=12, bbox=dict(facecolor='white', alpha=0.7))
+
+    return save_figure(fig, path)
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def generate_linear_data_with_noise(A, B, num_points, x_range=(0, 1), noise_std=0.5):
@@ -39,38 +38,20 @@ A = 0.5  # שיפוע
 B = 0.1  # חיתוך ציר Y
 NUM_POINTS = 1000  # מספר נקודות
 
-# 2. יצירת רעש בטווח 0-1
-noise_level = np.random.uniform(0, 1)
 
-# 3. יצירת הנקודות
-X, Y, Y_perfect = generate_linear_data_with_noise(A, B, NUM_POINTS, noise_std=noise_level)
+if __name__ == "__main__":
+    import reporting
 
-# 4. חישוב A,B מהנקודות
-A_calc, B_calc = calculate_least_squares_vectorized(X, Y)
+    # 2. יצירת רעש בטווח 0-1
+    noise_level = np.random.uniform(0, 1)
 
-# 5. הצגת הנקודות והקווים
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    # 3. יצירת הנקודות
+    X, Y, Y_perfect = generate_linear_data_with_noise(A, B, NUM_POINTS, noise_std=noise_level)
 
-# First plot - points with original line
-ax1.scatter(X, Y, alpha=0.6, s=10, color='blue', label=f'Points ({NUM_POINTS})')
-X_line = np.linspace(0, 1, 100)
-Y_line = A * X_line + B
-ax1.plot(X_line, Y_line, 'r-', linewidth=2, label=f'Original line: Y = {A}X + {B}')
-ax1.set_xlabel('X')
-ax1.set_ylabel('Y')
-ax1.set_title('Points with Original Line')
-ax1.legend()
-ax1.grid(True, alpha=0.3)
+    # 4. חישוב A,B מהנקודות
+    A_calc, B_calc = calculate_least_squares_vectorized(X, Y)
 
-# Second plot - same points with calculated line
-ax2.scatter(X, Y, alpha=0.6, s=10, color='blue', label=f'Points ({NUM_POINTS})')
-Y_calc_line = A_calc * X_line + B_calc
-ax2.plot(X_line, Y_calc_line, 'g-', linewidth=2, label=f'Calculated line: Y = {A_calc:.3f}X + {B_calc:.3f}')
-ax2.set_xlabel('X')
-ax2.set_ylabel('Y')
-ax2.set_title('Points with Least Squares Line')
-ax2.legend()
-ax2.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+    # 5. הצגת הנקודות והקווים
+    path = reporting.plot_least_squares_fit(X, Y, A, B, A_calc, B_calc, 'plots/gradiant_funder.png')
+    print(f"Calculated line: Y = {A_calc:.3f}X + {B_calc:.3f}")
+    print("Plot saved to", path)
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def linear_regression_analysis(k, n, num_datasets=50):
@@ -65,21 +64,10 @@ def linear_regression_analysis(k, n, num_datasets=50):
     return r_squared_values, sigma_values
 
 
-def plot_r_vs_sigma(r_squared_values, sigma_values):
-    """
-    7. מציג גרף של R² כפונקציה של σ
-    """
-    plt.figure(figsize=(8, 6))
-    plt.scatter(sigma_values, r_squared_values)
-    plt.xlabel('σ (סטיית תקן השגיאות)')
-    plt.ylabel('R² (מקדם הקביעה)')
-    plt.title('R² כפונקציה של σ\n(ככל ש-σ קטן יותר, R² גדול יותר)')
-    plt.grid(True)
-    plt.show()
-
-
 # הרצת הקוד
 if __name__ == "__main__":
+    import reporting
+
     # 4. k,n כפרמטרים
     k = 50  # מספר משתנים בלתי תלויים
     n = 20  # מספר תצפיות
@@ -88,4 +76,5 @@ if __name__ == "__main__":
     r_squared_values, sigma_values = linear_regression_analysis(k, n)
 
     # הצגת הגרף
-    plot_r_vs_sigma(r_squared_values, sigma_values)
\ No newline at end of file
+    path = reporting.plot_r_vs_sigma(r_squared_values, sigma_values, 'plots/r_squared_part_B.png')
+    print("Plot saved to", path)
@@ -0,0 +1,116 @@
+"""
+Plots for the L8 regression scripts, saved to image files (same setup as L7/reporting.py)
+"""
+import os
+import sys
+
+import numpy as np
+
+
+def _pyplot():
+    # Pick the headless backend only on the first import of pyplot, so an
+    # interactive session the caller already set up is left alone
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_figure(fig, path):
+    """Write a figure to `path` (creating its directory) and release it"""
+    plt = _pyplot()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(path, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+
+def plot_least_squares_fit(X, Y, A, B, A_calc, B_calc, path):
+    """The points with the original line, and with the least squares line"""
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    X_line = np.linspace(0, 1, 100)
+
+    # First plot - points with original line
+    ax1.scatter(X, Y, alpha=0.6, s=10, color='blue', label=f'Points ({len(X)})')
+    ax1.plot(X_line, A * X_line + B, 'r-', linewidth=2, label=f'Original line: Y = {A}X + {B}')
+    ax1.set_xlabel('X')
+    ax1.set_ylabel('Y')
+    ax1.set_title('Points with Original Line')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Second plot - same points with calculated line
+    ax2.scatter(X, Y, alpha=0.6, s=10, color='blue', label=f'Points ({len(X)})')
+    ax2.plot(X_line, A_calc * X_line + B_calc, 'g-', linewidth=2,
+             label=f'Calculated line: Y = {A_calc:.3f}X + {B_calc:.3f}')
+    ax2.set_xlabel('X')
+    ax2.set_ylabel('Y')
+    ax2.set_title('Points with Least Squares Line')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return save_figure(fig, path)
+
+
+def plot_r_squared_vs_sigma(sigma_values, r_squared_values, title, path):
+    """
+    R² as a function of σ with its trend line (part A)
+    """
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.scatter(sigma_values, r_squared_values, color='darkblue', alpha=0.7, s=120,
+               edgecolors='black', linewidth=1.5)
+    ax.plot(sigma_values, r_squared_values, 'r-', alpha=0.6, linewidth=2.5, label='Trend')
+
+    ax.set_xlabel('σ (Standard Deviation of Error)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('R² (Coefficient of Determination)', fontsize=14, fontweight='bold')
+    ax.set_title(title, fontsize=16, fontweight='bold')
+    ax.grid(True, alpha=0.4, linestyle='--')
+    ax.legend(fontsize=12, loc='upper right')
+    fig.tight_layout()
+    return save_figure(fig, path)
+
+
+def plot_r_squared_trend(sigma_values, series, title, path):
+    """
+    R² curves as a function of σ (part C)
+
+    Parameters:
+    sigma_values (list): σ of each simulation
+    series (list): (values, label, point_color, line_color) per curve
+    title (str): Plot title
+    path (str): Output image file
+    """
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(12, 7))
+    for values, label, point_color, line_color in series:
+        ax.scatter(sigma_values, values, color=point_color, alpha=0.7, s=120,
+                   edgecolors='black', linewidth=1.5, label=label, zorder=3)
+        ax.plot(sigma_values, values, '-', color=line_color, alpha=0.5, linewidth=2.5)
+
+    ax.set_xlabel('σ (Standard Deviation of Error)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('R² Values', fontsize=14, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.4, linestyle='--')
+    ax.legend(fontsize=13, loc='upper right', framealpha=0.9)
+    fig.tight_layout()
+    return save_figure(fig, path)
+
+
+def plot_r_vs_sigma(r_squared_values, sigma_values, path):
+    """
+    7. מציג גרף של R² כפונקציה של σ
+    """
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.scatter(sigma_values, r_squared_values)
+    ax.set_xlabel('σ (סטיית תקן השגיאות)')
+    ax.set_ylabel('R² (מקדם הקביעה)')
+    ax.set_title('R² כפונקציה של σ\n(ככל ש-σ קטן יותר, R² גדול יותר)')
+    ax.grid(True)
+    return save_figure(fig, path)